@@ -8,98 +8,389 @@ Analyzer: Takes extracted slide data and produces aggregated analysis:
   - Sample text for few-shot prompting
 """
 
+import os
 import re
 import json
-from collections import Counter, defaultdict
+import heapq
+import random
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from operator import itemgetter
 
 import numpy as np
+from scipy.cluster.vq import kmeans2
+
+try:
+    import orjson  # optional: much faster parsing of extracted slides
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Precompiled patterns used in the per-slide loops
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_PHRASE_CLEAN_RE = re.compile(r'[^\w\s/&()-]')
+_ACRONYM_TOKEN_RE = re.compile(r'[A-Z][A-Z0-9/&]{1,8}')
+_EXPANSION_TAIL_RE = re.compile(r'((?:[A-Z][a-z]+[\s,&-]*){2,8})\s*$')
+_WS_RE = re.compile(r'\s+')
+_TRAIL_PUNCT_RE = re.compile(r'[:\-–—]+$')
+_TRAIL_PUNCT_CHARS = frozenset(':-–—')
+
+# Maps every ASCII char that is not a regex word char (\w) to a space, so
+# splitting translated ASCII text yields whole \w-runs
+_NON_WORD_TO_SPACE = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")
+})
+
+# How far back from "(ACRONYM)" to look for its capitalized expansion
+_EXPANSION_WINDOW = 200
+
+# Vocabulary counting only fans out to worker processes once each shard
+# would get at least this many slides; below that, startup costs dominate
+_MIN_SLIDES_PER_SHARD = 1000
+
+# Cap on slides per vocabulary shard. Shards are cut lazily with about one
+# in flight per worker, so this bounds how much slide text is held at once
+_MAX_SLIDES_PER_SHARD = 5000
+
+# Most candidate expansions tracked per acronym; past that, only candidates
+# seen once are evicted to make room
+_MAX_EXPANSIONS_PER_ACRONYM = 16
+
+# Number of k-means clusters for the corpus-wide palette
+_PALETTE_CLUSTERS = 8
+
+
+# Slide fields read by the analyzer, in the order _slide_fields returns them.
+# PDFExtractor always sets every key; the defaults cover hand-built slides.
+_SLIDE_DEFAULTS = {
+    "full_text": "",
+    "slide_type": "unknown",
+    "title": "",
+    "acronyms": [],
+    "colors": [],
+    "num_text_blocks": 0,
+    "source_file": "",
+}
+_get_slide_fields = itemgetter(*_SLIDE_DEFAULTS)
+
+
+# Common English stop words to exclude from vocabulary
+_STOP_WORDS = frozenset("""
+    the a an is are was were be been being have has had do does did
+    will would shall should may might can could of in to for with on
+    at by from as into through during before after above below between
+    out off over under again further then once here there when where
+    why how all each every both few more most other some such no not
+    only own same so than too very just because but and or if while
+    this that these those it its he she they them their his her we
+    our you your i me my which what who whom whose about also any
+    another back even still already much many since however although
+    well also more most just only than so very really quite rather
+""".split())
+
+
+def _slide_fields(slide):
+    """
+    Fetch (text, slide_type, title, acronyms, colors, num_blocks, source_file)
+    from a slide with a single C-level itemgetter call.
+    """
+    try:
+        return _get_slide_fields(slide)
+    except KeyError:
+        return _get_slide_fields({**_SLIDE_DEFAULTS, **slide})
+
+
+def _top_counts(counter, n, min_count):
+    """
+    Return the n most common (item, count) pairs with count >= min_count.
+    Drops rare items before heap selection so singletons are never sorted.
+    """
+    frequent = [(item, count) for item, count in counter.items() if count >= min_count]
+    return heapq.nlargest(n, frequent, key=itemgetter(1))
+
+
+class JsonlSlides:
+    """
+    Re-iterable view of slides stored as JSON Lines (see
+    PDFExtractor.process_all). Each pass streams the file one slide at a
+    time instead of loading the whole corpus.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._len = None
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+
+    def __len__(self):
+        if self._len is None:
+            with open(self.path, "rb") as f:
+                self._len = sum(1 for line in f if line.strip())
+        return self._len
+
+
+@dataclass
+class AnalyzerState:
+    """
+    Running aggregates collected in a single pass over the slides.
+    """
+    words_by_type: dict = field(default_factory=lambda: defaultdict(Counter))
+    phrases_by_type: dict = field(default_factory=lambda: defaultdict(Counter))
+    acronyms: Counter = field(default_factory=Counter)
+    potential_expansions: dict = field(default_factory=lambda: defaultdict(dict))
+    palettes_by_type: dict = field(default_factory=lambda: defaultdict(list))
+    palette_colors: list = field(default_factory=list)
+    samples_by_type: dict = field(default_factory=lambda: defaultdict(list))
+    type_ids: dict = field(default_factory=dict)
+    slide_type_ids: list = field(default_factory=list)
+    title_counter: Counter = field(default_factory=Counter)
+    sources: set = field(default_factory=set)
 
 
 class SlideAnalyzer:
 
-    # Common English stop words to exclude from vocabulary
-    STOP_WORDS = set("""
-        the a an is are was were be been being have has had do does did
-        will would shall should may might can could of in to for with on
-        at by from as into through during before after above below between
-        out off over under again further then once here there when where
-        why how all each every both few more most other some such no not
-        only own same so than too very just because but and or if while
-        this that these those it its he she they them their his her we
-        our you your i me my which what who whom whose about also any
-        another back even still already much many since however although
-        well also more most just only than so very really quite rather
-    """.split())
-
-    def __init__(self):
-        pass
+    STOP_WORDS = _STOP_WORDS
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+
+    # ------------------------------------------------------------------
+    # Per-slide accumulation
+    # ------------------------------------------------------------------
+
+    def _update_vocabulary(self, state, text, slide_type):
+        # Extract meaningful words/phrases
+        state.words_by_type[slide_type].update(self._extract_words(text))
+
+        # Also extract multi-word phrases (bigrams/trigrams)
+        word_list = text.split()
+        bigrams = (a + " " + b for a, b in zip(word_list, word_list[1:]))
+        trigrams = (
+            a + " " + b + " " + c
+            for a, b, c in zip(word_list, word_list[1:], word_list[2:])
+        )
+        # Only keep phrases that look meaningful. Count repeats within the
+        # slide first so each distinct phrase is cleaned just once.
+        local = Counter(
+            phrase for phrase in chain(bigrams, trigrams)
+            if len(phrase) > 6 and not phrase[0].isdigit()
+        )
+        phrase_counts = state.phrases_by_type[slide_type]
+        for phrase, count in local.items():
+            cleaned = _PHRASE_CLEAN_RE.sub('', phrase)
+            if cleaned:
+                phrase_counts[cleaned.lower()] += count
+
+    def _extract_words(self, text):
+        """
+        Lowercased 3+ letter words that are not stop words; same result as
+        _WORD_RE.findall(text.lower()).
+        """
+        # Lowercase once per slide so the words come back pre-lowered
+        lower_text = text.lower()
+        if not lower_text.isascii():
+            # translate() falls back to a slow per-char path as soon as the
+            # text has a char outside Latin-1 (bullets, curly quotes, dashes)
+            return [w for w in _WORD_RE.findall(lower_text) if w not in _STOP_WORDS]
+        # ASCII text: every split chunk is a whole \w-run, so keep the
+        # all-letter ones without running the regex
+        return [
+            w for w in lower_text.translate(_NON_WORD_TO_SPACE).split()
+            if len(w) >= 3 and w.isalpha() and w not in _STOP_WORDS
+        ]
 
-    def build_vocabulary(self, slides):
+    def _update_acronyms(self, state, text, acronyms):
+        state.acronyms.update(acronyms)
+
+        # Try to find expansions: look for "Full Name (ACRONYM)" patterns
+        for expansion, acronym in self._find_expansions(text):
+            self._record_expansion(state, acronym, expansion.strip())
+
+    def _record_expansion(self, state, acronym, expansion):
         """
-        Build frequency-weighted vocabulary lists, segmented by slide type.
+        Count one sighting of an expansion, keeping at most
+        _MAX_EXPANSIONS_PER_ACRONYM candidates per acronym. Counts stay
+        exact: once full, a new candidate only replaces one seen a single
+        time (the newest such), and is dropped if every slot holds a repeat.
         """
-        vocab_by_type = defaultdict(Counter)
-        overall_vocab = Counter()
+        counts = state.potential_expansions[acronym]
+        if expansion in counts:
+            counts[expansion] += 1
+            return
+        if len(counts) >= _MAX_EXPANSIONS_PER_ACRONYM:
+            victim = next((e for e in reversed(counts) if counts[e] == 1), None)
+            if victim is None:
+                return
+            del counts[victim]
+        counts[expansion] = 1
+
+    def _update_palettes(self, state, colors, slide_type):
+        if len(colors) >= 2:
+            palette = [c["hex"] for c in colors[:5]]
+            state.palettes_by_type[slide_type].append(palette)
+            state.palette_colors.extend(palette)
+
+    def _update_samples(self, state, text, title, slide_type, num_blocks):
+        text = text.strip()
+
+        # Skip very short or very long slides
+        if len(text) < 50 or len(text) > 1500:
+            return
+
+        state.samples_by_type[slide_type].append({
+            "title": title.strip()[:200],
+            "text": text[:1000],
+            "num_blocks": num_blocks,
+        })
 
+    def _update_type_distribution(self, state, slide_type):
+        type_ids = state.type_ids
+        state.slide_type_ids.append(type_ids.setdefault(slide_type, len(type_ids)))
+
+    def _update_titles(self, state, title):
+        title = title.strip()
+        if title and len(title) > 3:
+            # Normalize: uppercase, strip trailing punctuation.
+            # Every whitespace char except " " is non-printable, so most
+            # titles can skip the regexes entirely.
+            normalized = title.upper().strip()
+            if "  " in normalized or not normalized.isprintable():
+                normalized = _WS_RE.sub(' ', normalized)
+            if normalized[-1:] in _TRAIL_PUNCT_CHARS:
+                normalized = _TRAIL_PUNCT_RE.sub('', normalized).strip()
+            if normalized:
+                state.title_counter[normalized] += 1
+
+    def _update_from_slide(self, state, slide, include_vocabulary=True):
+        """
+        Fold one slide into every aggregate at once. Vocabulary can be left
+        out when it is being counted separately by worker processes.
+        Returns the slide's (text, slide_type).
+        """
+        text, slide_type, title, acronyms, colors, num_blocks, source_file = _slide_fields(slide)
+        if include_vocabulary:
+            self._update_vocabulary(state, text, slide_type)
+        self._update_acronyms(state, text, acronyms)
+        self._update_palettes(state, colors, slide_type)
+        self._update_samples(state, text, title, slide_type, num_blocks)
+        self._update_type_distribution(state, slide_type)
+        self._update_titles(state, title)
+        state.sources.add(source_file)
+        return text, slide_type
+
+    def _iter_updated(self, state, slides):
+        """
+        Fold each slide into every aggregate except vocabulary, yielding its
+        (text, slide_type) so vocabulary shards are cut in the same pass.
+        """
         for slide in slides:
-            text = slide.get("full_text", "")
-            slide_type = slide.get("slide_type", "bullets")
-
-            # Extract meaningful words/phrases
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text)
-            words = [w.lower() for w in words if w.lower() not in self.STOP_WORDS]
-
-            vocab_by_type[slide_type].update(words)
-            overall_vocab.update(words)
-
-            # Also extract multi-word phrases (bigrams/trigrams)
-            word_list = text.split()
-            for n in [2, 3]:
-                for i in range(len(word_list) - n + 1):
-                    phrase = " ".join(word_list[i:i+n]).strip()
-                    # Only keep phrases that look meaningful
-                    if len(phrase) > 6 and not phrase[0].isdigit():
-                        cleaned = re.sub(r'[^\w\s/&()-]', '', phrase)
-                        if cleaned:
-                            vocab_by_type[slide_type][cleaned.lower()] += 1
-                            overall_vocab[cleaned.lower()] += 1
+            yield self._update_from_slide(state, slide, include_vocabulary=False)
+
+    def _find_expansions(self, text):
+        """
+        Yield (expansion, acronym) pairs for "Full Name (ACRONYM)" patterns.
+        Scans for parenthesized acronyms with plain string search and only
+        runs the phrase regex on a short window before each candidate.
+        """
+        find = text.find
+        start = find("(")
+        while start != -1:
+            end = find(")", start + 1)
+            if end == -1:
+                return
+            acronym = text[start + 1:end]
+            if _ACRONYM_TOKEN_RE.fullmatch(acronym):
+                window = text[max(0, start - _EXPANSION_WINDOW):start]
+                match = _EXPANSION_TAIL_RE.search(window)
+                if match:
+                    yield match.group(1), acronym
+            start = find("(", start + 1)
+
+    # ------------------------------------------------------------------
+    # Finalization of the aggregated state
+    # ------------------------------------------------------------------
+
+    def _count_vocabulary(self, state):
+        vocab_by_type = {}
+        for slide_type, counter in state.words_by_type.items():
+            counter.update(state.phrases_by_type[slide_type])
+            vocab_by_type[slide_type] = counter
+        return vocab_by_type
+
+    def _count_vocabulary_pairs(self, pairs):
+        state = AnalyzerState()
+        for text, slide_type in pairs:
+            self._update_vocabulary(state, text, slide_type)
+        return self._count_vocabulary(state)
+
+    def _num_vocab_shards(self, num_slides):
+        return min(self.workers, num_slides // _MIN_SLIDES_PER_SHARD)
+
+    def _count_vocabulary_parallel(self, pairs, num_slides):
+        """
+        Count vocabulary over an iterable of (text, slide_type) pairs in
+        worker processes. Shards are cut from the iterable lazily and at
+        most one per worker is in flight, so only a bounded window of slide
+        text is held in memory. Results are merged in shard order.
+        """
+        max_workers = self._num_vocab_shards(num_slides)
+        shard_size = min(max(-(-num_slides // max_workers), _MIN_SLIDES_PER_SHARD),
+                         _MAX_SLIDES_PER_SHARD)
+
+        vocab_by_type = defaultdict(Counter)
+
+        def merge(future):
+            for slide_type, counter in future.result().items():
+                vocab_by_type[slide_type].update(counter)
+
+        pairs = iter(pairs)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                shard = list(islice(pairs, shard_size))
+                if not shard:
+                    break
+                if len(pending) >= max_workers:
+                    merge(pending.popleft())
+                pending.append(executor.submit(_build_vocab_shard, shard))
+            while pending:
+                merge(pending.popleft())
+        return vocab_by_type
+
+    def _finalize_vocabulary(self, state):
+        return self._format_vocabulary(self._count_vocabulary(state))
+
+    def _format_vocabulary(self, vocab_by_type):
+        overall_vocab = Counter()
+        for counter in vocab_by_type.values():
+            overall_vocab.update(counter)
 
         # Convert to sorted lists with counts
         result = {}
         for slide_type, counter in vocab_by_type.items():
             result[slide_type] = [
                 {"term": term, "count": count}
-                for term, count in counter.most_common(500)
-                if count >= 2  # Only keep terms appearing 2+ times
+                # Only keep terms appearing 2+ times
+                for term, count in _top_counts(counter, 500, 2)
             ]
 
         result["_overall"] = [
             {"term": term, "count": count}
-            for term, count in overall_vocab.most_common(1000)
-            if count >= 3
+            for term, count in _top_counts(overall_vocab, 1000, 3)
         ]
 
         return result
 
-    def build_acronym_db(self, slides):
-        """
-        Build a frequency-sorted acronym database.
-        Attempts to find expansions by looking for capitalized phrases
-        that match the acronym pattern.
-        """
-        acronym_counter = Counter()
-        potential_expansions = defaultdict(Counter)
-
-        for slide in slides:
-            acronyms = slide.get("acronyms", [])
-            text = slide.get("full_text", "")
-            acronym_counter.update(acronyms)
-
-            # Try to find expansions: look for "Full Name (ACRONYM)" patterns
-            expansion_pattern = r'((?:[A-Z][a-z]+[\s,&-]*){2,8})\s*\(([A-Z][A-Z0-9/&]{1,8})\)'
-            matches = re.findall(expansion_pattern, text)
-            for expansion, acronym in matches:
-                potential_expansions[acronym][expansion.strip()] += 1
+    def _finalize_acronyms(self, state):
+        acronym_counter = state.acronyms
+        potential_expansions = state.potential_expansions
 
         # Build final list
         result = []
@@ -108,45 +399,18 @@ class SlideAnalyzer:
 
             # Add most common expansion if found
             if acronym in potential_expansions:
-                best_expansion = potential_expansions[acronym].most_common(1)[0][0]
-                entry["expansion"] = best_expansion
+                counts = potential_expansions[acronym]
+                entry["expansion"] = max(counts, key=counts.get)
 
             result.append(entry)
 
         return result
 
-    def analyze_color_palettes(self, slides):
-        """
-        Cluster extracted colors into common palettes.
-        Returns list of palette objects.
-        """
-        all_palettes = []
-
-        for slide in slides:
-            colors = slide.get("colors", [])
-            if len(colors) >= 2:
-                palette = [c["hex"] for c in colors[:5]]
-                all_palettes.append({
-                    "colors": palette,
-                    "slide_type": slide.get("slide_type", "unknown"),
-                })
-
-        # Find most common color combinations by counting individual colors
-        color_counter = Counter()
-        for p in all_palettes:
-            for c in p["colors"]:
-                color_counter[c] += 1
-
-        # Group palettes by slide type
-        palettes_by_type = defaultdict(list)
-        for p in all_palettes:
-            palettes_by_type[p["slide_type"]].append(p["colors"])
-
+    def _finalize_palettes(self, state):
         # Pick representative palettes
         result = []
-        for slide_type, palettes in palettes_by_type.items():
+        for slide_type, palettes in state.palettes_by_type.items():
             # Take up to 5 random palettes per type
-            import random
             sample = random.sample(palettes, min(5, len(palettes)))
             for palette in sample:
                 result.append({
@@ -154,100 +418,179 @@ class SlideAnalyzer:
                     "colors": palette,
                 })
 
+        if not state.palette_colors:
+            result.append({"slide_type": "_overall", "colors": []})
+            return result
+
+        # Count individual colors as packed 0xRRGGBB integers
+        packed = np.fromiter(
+            (int(h.lstrip("#"), 16) for h in state.palette_colors),
+            dtype=np.uint32,
+            count=len(state.palette_colors),
+        )
+        values, counts = np.unique(packed, return_counts=True)
+
+        # Cluster the distinct colors in RGB space, ranked by how often
+        # their member colors were seen
+        if len(values) > _PALETTE_CLUSTERS:
+            rgb = np.stack([(values >> 16) & 0xFF, (values >> 8) & 0xFF, values & 0xFF], axis=1)
+            centroids, labels = kmeans2(rgb.astype(np.float32), _PALETTE_CLUSTERS, minit="++")
+            weights = np.bincount(labels, weights=counts, minlength=_PALETTE_CLUSTERS)
+            centroids = np.clip(np.rint(centroids), 0, 255).astype(np.uint32)
+            result.append({
+                "slide_type": "_clustered",
+                "colors": [
+                    "#%02x%02x%02x" % tuple(centroids[i])
+                    for i in np.argsort(-weights, kind="stable")
+                    if weights[i] > 0
+                ],
+            })
+
         # Add the overall top colors
+        top = np.argsort(-counts, kind="stable")[:10]
         result.append({
             "slide_type": "_overall",
-            "colors": [c for c, _ in color_counter.most_common(10)],
+            "colors": ["#%06x" % v for v in values[top]],
         })
 
         return result
 
-    def collect_sample_text(self, slides, samples_per_type=10):
+    def _finalize_samples(self, state, samples_per_type=10):
+        # Sample from each type
+        result = {}
+        for slide_type, examples in state.samples_by_type.items():
+            k = min(samples_per_type, len(examples))
+            result[slide_type] = random.sample(examples, k)
+
+        return result
+
+    def _finalize_type_distribution(self, state):
+        # Slide types are a handful of categories, so count their integer
+        # ids with one bincount instead of hashing every slide into a Counter
+        ids = np.fromiter(state.slide_type_ids, dtype=np.int32, count=len(state.slide_type_ids))
+        counts = np.bincount(ids, minlength=len(state.type_ids))
+        total = len(ids)
+        types = list(state.type_ids)
+        return {
+            types[i]: {
+                "count": int(counts[i]),
+                "percentage": round(int(counts[i]) / total * 100, 1),
+            }
+            for i in np.argsort(-counts, kind="stable")
+        }
+
+    def _finalize_titles(self, state, top_n=200):
+        return [
+            {"title": title, "count": count}
+            for title, count in _top_counts(state.title_counter, top_n, 2)
+        ]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def build_vocabulary(self, slides):
         """
-        Collect representative sample text for few-shot prompting.
-        Picks diverse, medium-length examples for each slide type.
+        Build frequency-weighted vocabulary lists, segmented by slide type.
+        Large corpora are split into contiguous shards counted in parallel
+        worker processes, since the per-slide regex work holds the GIL.
         """
-        by_type = defaultdict(list)
+        # Workers only need the text and type, not the whole slide dict
+        num_slides = len(slides)
+        pairs = ((text, slide_type) for text, slide_type, *_ in map(_slide_fields, slides))
+        if self._num_vocab_shards(num_slides) < 2:
+            return self._format_vocabulary(self._count_vocabulary_pairs(pairs))
+        return self._format_vocabulary(self._count_vocabulary_parallel(pairs, num_slides))
 
-        for slide in slides:
-            slide_type = slide.get("slide_type", "bullets")
-            text = slide.get("full_text", "").strip()
-            title = slide.get("title", "").strip()
-
-            # Skip very short or very long slides
-            if len(text) < 50 or len(text) > 1500:
-                continue
-
-            by_type[slide_type].append({
-                "title": title[:200],
-                "text": text[:1000],
-                "num_blocks": slide.get("num_text_blocks", 0),
-            })
+    def build_acronym_db(self, slides):
+        """
+        Build a frequency-sorted acronym database.
+        Attempts to find expansions by looking for capitalized phrases
+        that match the acronym pattern.
+        """
+        state = AnalyzerState()
+        for text, _, _, acronyms, *_ in map(_slide_fields, slides):
+            self._update_acronyms(state, text, acronyms)
+        return self._finalize_acronyms(state)
 
-        # Sample from each type
-        import random
-        result = {}
-        for slide_type, examples in by_type.items():
-            random.shuffle(examples)
-            result[slide_type] = examples[:samples_per_type]
+    def analyze_color_palettes(self, slides):
+        """
+        Cluster extracted colors into common palettes.
+        Returns list of palette objects.
+        """
+        state = AnalyzerState()
+        for _, slide_type, _, _, colors, *_ in map(_slide_fields, slides):
+            self._update_palettes(state, colors, slide_type)
+        return self._finalize_palettes(state)
 
-        return result
+    def collect_sample_text(self, slides, samples_per_type=10):
+        """
+        Collect representative sample text for few-shot prompting.
+        Picks diverse, medium-length examples for each slide type.
+        """
+        state = AnalyzerState()
+        for text, slide_type, title, _, _, num_blocks, _ in map(_slide_fields, slides):
+            self._update_samples(state, text, title, slide_type, num_blocks)
+        return self._finalize_samples(state, samples_per_type)
 
     def compute_slide_type_distribution(self, slides):
         """
         Count how often each slide type appears.
         """
-        counter = Counter(s.get("slide_type", "unknown") for s in slides)
-        total = sum(counter.values())
-        return {
-            slide_type: {
-                "count": count,
-                "percentage": round(count / total * 100, 1),
-            }
-            for slide_type, count in counter.most_common()
-        }
+        state = AnalyzerState()
+        for _, slide_type, *_ in map(_slide_fields, slides):
+            self._update_type_distribution(state, slide_type)
+        return self._finalize_type_distribution(state)
 
     def extract_common_titles(self, slides, top_n=200):
         """
         Find the most common slide titles.
         """
-        title_counter = Counter()
-        for slide in slides:
-            title = slide.get("title", "").strip()
-            if title and len(title) > 3:
-                # Normalize: uppercase, strip trailing punctuation
-                normalized = re.sub(r'[\s]+', ' ', title.upper().strip())
-                normalized = re.sub(r'[:\-–—]+$', '', normalized).strip()
-                if normalized:
-                    title_counter[normalized] += 1
-
-        return [
-            {"title": title, "count": count}
-            for title, count in title_counter.most_common(top_n)
-            if count >= 2
-        ]
+        state = AnalyzerState()
+        for _, _, title, *_ in map(_slide_fields, slides):
+            self._update_titles(state, title)
+        return self._finalize_titles(state, top_n)
 
     def analyze(self, slides):
         """
         Main analysis entry point. Returns comprehensive analysis dict.
+        All aggregates are gathered in a single pass over the slides.
         """
-        print(f"  Analyzing {len(slides)} slides...")
+        num_slides = len(slides)
+        print(f"  Analyzing {num_slides} slides...")
+
+        # Vocabulary dominates the cost; on large corpora the fused pass
+        # hands each slide's text to worker processes as it goes, so the
+        # slides are still only read once
+        parallel_vocab = self._num_vocab_shards(num_slides) > 1
+
+        state = AnalyzerState()
+        if parallel_vocab:
+            vocab_by_type = self._count_vocabulary_parallel(
+                self._iter_updated(state, slides), num_slides
+            )
+        else:
+            for slide in slides:
+                self._update_from_slide(state, slide)
 
         print("  Building vocabulary...")
-        vocabulary = self.build_vocabulary(slides)
+        if parallel_vocab:
+            vocabulary = self._format_vocabulary(vocab_by_type)
+        else:
+            vocabulary = self._finalize_vocabulary(state)
 
         print("  Building acronym database...")
-        acronyms = self.build_acronym_db(slides)
+        acronyms = self._finalize_acronyms(state)
 
         print("  Analyzing color palettes...")
-        palettes = self.analyze_color_palettes(slides)
+        palettes = self._finalize_palettes(state)
 
         print("  Collecting sample text...")
-        sample_text = self.collect_sample_text(slides)
+        sample_text = self._finalize_samples(state)
 
         print("  Computing distributions...")
-        type_distribution = self.compute_slide_type_distribution(slides)
-        common_titles = self.extract_common_titles(slides)
+        type_distribution = self._finalize_type_distribution(state)
+        common_titles = self._finalize_titles(state)
 
         return {
             "vocabulary": vocabulary,
@@ -257,21 +600,32 @@ class SlideAnalyzer:
             "type_distribution": type_distribution,
             "common_titles": common_titles,
             "stats": {
-                "total_slides": len(slides),
-                "unique_sources": len(set(s.get("source_file", "") for s in slides)),
+                "total_slides": num_slides,
+                "unique_sources": len(state.sources),
             },
         }
 
 
+def _build_vocab_shard(pairs):
+    """
+    Count vocabulary for one shard of (text, slide_type) pairs.
+    Module-level so ProcessPoolExecutor can pickle it.
+    """
+    return SlideAnalyzer(workers=1)._count_vocabulary_pairs(pairs)
+
+
 if __name__ == "__main__":
     import sys
-    # Test with a JSON file of extracted slides
+    # Test with a JSON (list) or JSON Lines file of extracted slides
     if len(sys.argv) < 2:
-        print("Usage: python analyzer.py <extracted_slides.json>")
+        print("Usage: python analyzer.py <extracted_slides.json|.jsonl>")
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        slides = json.load(f)
+    if sys.argv[1].endswith(".jsonl"):
+        slides = JsonlSlides(sys.argv[1])
+    else:
+        with open(sys.argv[1]) as f:
+            slides = json.load(f)
 
     analyzer = SlideAnalyzer()
     analysis = analyzer.analyze(slides)
@@ -7,6 +7,11 @@ that the web app can load for slide generation.
 import os
 import json
 
+try:
+    import orjson  # optional: much faster serialization for large corpus files
+except ImportError:
+    orjson = None
+
 
 class CorpusBuilder:
 
@@ -14,11 +19,18 @@ class CorpusBuilder:
         self.corpus_dir = corpus_dir
         os.makedirs(corpus_dir, exist_ok=True)
 
-    def _write_json(self, filename, data):
+    def _write_json(self, filename, data, indent=True):
         path = os.path.join(self.corpus_dir, filename)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
-        size_kb = os.path.getsize(path) / 1024
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        elif indent:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        else:
+            payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(payload)
+        size_kb = len(payload) / 1024
         print(f"  Wrote {filename} ({size_kb:.1f} KB)")
 
     def build(self, analysis):
@@ -47,9 +59,9 @@ class CorpusBuilder:
         })
 
         # 7. Build a combined "slim" corpus for the frontend
-        #    (smaller file that the React app can load directly)
+        #    (smaller file that the React app can load directly, so no indent)
         slim = self._build_slim_corpus(analysis)
-        self._write_json("slim_corpus.json", slim)
+        self._write_json("slim_corpus.json", slim, indent=False)
 
         print(f"\n  All corpus files written to {self.corpus_dir}/")
 
@@ -14,8 +14,12 @@ We use:
 import os
 import json
 import time
+import hashlib
 import random
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import httpx
 from tqdm import tqdm
 
 
@@ -28,13 +32,70 @@ class ArchiveCrawler:
     HEADERS = {
         "User-Agent": "PentagonBriefingGenerator/1.0 (educational research project)"
     }
-    REQUEST_DELAY = 1.0  # seconds between API calls
+    # Seconds between request starts, shared by metadata calls and every
+    # download thread, so the whole fleet stays under ~1 req/sec
+    REQUEST_DELAY = 1.0
+    MAX_WORKERS = 8  # concurrent PDF downloads
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB writes when streaming PDFs to disk
+    CACHE_TTL = 86400  # seconds to reuse cached search/metadata responses
 
     def __init__(self, download_dir="downloads"):
         self.download_dir = download_dir
-        os.makedirs(download_dir, exist_ok=True)
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
+        self.cache_dir = os.path.join(download_dir, "_cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # One pooled HTTP/2 client shared by all download threads; metadata
+        # calls and downloads multiplex over a few keep-alive connections.
+        # archive.org download URLs redirect to storage nodes, so follow them.
+        self.session = httpx.Client(
+            http2=True,
+            headers=self.HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            timeout=60.0,
+            follow_redirects=True,
+        )
+
+        # Shared across download threads so the whole fleet stays polite
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def _throttle(self, delay):
+        """
+        Block until this caller may start a request, then reserve the next
+        slot `delay` seconds later. Safe to call from multiple threads.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            if self._next_request_at > now:
+                time.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + delay
+
+    def _get_json_cached(self, cache_name, url, params=None):
+        """
+        GET a JSON API response, reusing the copy in the local cache if it is
+        younger than CACHE_TTL. Only cache misses hit the network (and wait
+        on the rate limit), so reruns skip the API delays entirely.
+        """
+        path = os.path.join(self.cache_dir, cache_name)
+        try:
+            if time.time() - os.path.getmtime(path) < self.CACHE_TTL:
+                with open(path) as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass  # missing or corrupt — refetch
+
+        self._throttle(self.REQUEST_DELAY)
+        resp = self.session.get(url, params=params, timeout=30)
+        resp.raise_for_status()
+        data = resp.json()
+
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return data
+
+    def _download_throttled(self, identifier, filename):
+        self._throttle(self.REQUEST_DELAY)
+        return self.download_pdf(identifier, filename)
 
     def discover_items(self, domain_filter=None, max_items=500):
         """
@@ -61,10 +122,10 @@ class ArchiveCrawler:
                 "output": "json",
             }
 
+            cache_key = hashlib.sha1(f"{query}|{rows}|{page}".encode()).hexdigest()[:16]
+
             try:
-                resp = self.session.get(self.SEARCH_URL, params=params, timeout=30)
-                resp.raise_for_status()
-                data = resp.json()
+                data = self._get_json_cached(f"search_{cache_key}.json", self.SEARCH_URL, params)
 
                 docs = data.get("response", {}).get("docs", [])
                 if not docs:
@@ -79,7 +140,6 @@ class ArchiveCrawler:
 
                 print(f"  Found {len(items)} items so far (page {page})...")
                 page += 1
-                time.sleep(self.REQUEST_DELAY)
 
             except Exception as e:
                 print(f"  Error searching: {e}")
@@ -96,9 +156,7 @@ class ArchiveCrawler:
         url = self.METADATA_URL.format(identifier=identifier)
 
         try:
-            resp = self.session.get(url, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._get_json_cached(f"files_{identifier}.json", url)
 
             files = data if isinstance(data, list) else data.get("result", [])
             pdfs = []
@@ -132,12 +190,11 @@ class ArchiveCrawler:
         url = self.DOWNLOAD_URL.format(identifier=identifier, filename=filename)
 
         try:
-            resp = self.session.get(url, timeout=60, stream=True)
-            resp.raise_for_status()
-
-            with open(local_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with self.session.stream("GET", url, timeout=60) as resp:
+                resp.raise_for_status()
+                with open(local_path, "wb") as f:
+                    for chunk in resp.iter_bytes(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
 
             return local_path
 
@@ -165,41 +222,58 @@ class ArchiveCrawler:
         # Shuffle for variety (but keep some popular ones)
         random.shuffle(items)
 
-        # Step 2: Iterate through items, listing and downloading PDFs
+        # Step 2: Iterate through items, listing PDFs and downloading them
+        # on a thread pool. Downloads in flight count against `count` so we
+        # never fetch more than needed; failures free their slot again.
         downloaded = []
+        pending = set()
         pbar = tqdm(total=count, desc="Downloading PDFs")
 
-        for item in items:
-            if len(downloaded) >= count:
-                break
-
-            identifier = item["identifier"]
-            time.sleep(self.REQUEST_DELAY)
-
-            pdfs = self.list_pdfs_in_item(identifier)
-            if not pdfs:
-                continue
+        def collect(futures):
+            for future in futures:
+                local_path = future.result()
+                if local_path:
+                    downloaded.append(local_path)
+                    pbar.update(1)
 
-            # Download a random subset of PDFs from this item
-            # (some items have hundreds — we don't need them all)
-            sample_size = min(len(pdfs), max(1, (count - len(downloaded)) // 3))
-            sampled_pdfs = random.sample(pdfs, sample_size)
+        def wait_for_slot():
+            nonlocal pending
+            while pending and len(downloaded) + len(pending) >= count:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
 
-            for pdf_info in sampled_pdfs:
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for item in items:
+                wait_for_slot()
                 if len(downloaded) >= count:
                     break
 
-                # Skip very large files (>50MB) and very small ones (<10KB)
-                size = pdf_info["size"]
-                if size > 50_000_000 or size < 10_000:
+                identifier = item["identifier"]
+                pdfs = self.list_pdfs_in_item(identifier)
+                if not pdfs:
                     continue
 
-                time.sleep(self.REQUEST_DELAY * 0.5)
-                local_path = self.download_pdf(identifier, pdf_info["name"])
+                # Download a random subset of PDFs from this item
+                # (some items have hundreds — we don't need them all)
+                remaining = count - len(downloaded) - len(pending)
+                sample_size = min(len(pdfs), max(1, remaining // 3))
+                sampled_pdfs = random.sample(pdfs, sample_size)
 
-                if local_path:
-                    downloaded.append(local_path)
-                    pbar.update(1)
+                for pdf_info in sampled_pdfs:
+                    wait_for_slot()
+                    if len(downloaded) >= count:
+                        break
+
+                    # Skip very large files (>50MB) and very small ones (<10KB)
+                    size = pdf_info["size"]
+                    if size > 50_000_000 or size < 10_000:
+                        continue
+
+                    pending.add(executor.submit(
+                        self._download_throttled, identifier, pdf_info["name"]
+                    ))
+
+            collect(wait(pending).done)
 
         pbar.close()
         return downloaded
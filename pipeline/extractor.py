@@ -11,14 +11,63 @@ Uses PyMuPDF (fitz) for both text extraction and page rendering.
 import os
 import json
 import re
-from collections import Counter
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 
+import ahocorasick
 import fitz  # PyMuPDF
-from PIL import Image
-import io
 import numpy as np
 from tqdm import tqdm
 
+try:
+    import orjson  # optional: much faster serialization of extracted slides
+except ImportError:
+    orjson = None
+
+
+# Match patterns like: DARPA, JADC2, USD(R&E), C4ISR, NC3
+_ACRONYM_RE = re.compile(r'\b([A-Z][A-Z0-9/&]{1,8}(?:\([A-Z&/]+\))?)\b')
+
+# Slide-type keyword categories, one bit each (matched against lowercased text)
+(_AGENDA, _QUESTIONS, _BACKUP, _BUDGET, _BUDGET_AMOUNT,
+ _TIMELINE, _ORGCHART, _MATRIX) = (1 << i for i in range(8))
+
+_CATEGORY_KEYWORDS = {
+    _AGENDA: ("agenda", "outline", "overview", "table of contents"),
+    _QUESTIONS: ("question", "discussion", "??"),
+    _BACKUP: ("backup",),
+    _BUDGET: ("fy2", "fy1", "fydp", "budget", "funding", "$ in", "rdt&e", "procurement"),
+    _BUDGET_AMOUNT: ("total", "mil", "000", "$"),
+    _TIMELINE: ("timeline", "schedule", "milestone", "roadmap", "phased"),
+    _ORGCHART: ("organization", "command", "governance", "reporting"),
+    _MATRIX: ("risk", "matrix", "assessment", "status", "stoplight", "red", "yellow", "green"),
+}
+
+
+def _build_keyword_automaton():
+    """
+    One Aho-Corasick automaton over every category keyword; each keyword
+    maps to the OR of the category bits it belongs to.
+    """
+    automaton = ahocorasick.Automaton()
+    for bit, keywords in _CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, automaton.get(keyword, 0) | bit)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _dumps_line(obj):
+    """
+    Serialize one object as a UTF-8 JSON Lines record.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
 
 class PDFExtractor:
 
@@ -27,48 +76,75 @@ class PDFExtractor:
     SLIDE_WIDTH = 10.0  # inches
     SLIDE_HEIGHT = 7.5
 
-    def __init__(self):
-        pass
+    # Pages with no images, no colored text, no filled shapes and fewer
+    # stroked paths than this are plain text slides; color sampling is
+    # skipped for them
+    MIN_STROKES_FOR_COLORS = 10
+    # Pages per worker task when a deck is split across processes
+    PAGES_PER_TASK = 25
+
+    # Output caps per slide (characters / blocks)
+    MAX_FULL_TEXT_CHARS = 2000
+    MAX_BLOCK_TEXT_CHARS = 500
+    MAX_TEXT_BLOCKS = 20
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
 
     def extract_page_text(self, page):
         """
         Extract text blocks with position, font size, and font name.
-        Returns list of text block dicts.
+        Returns (list of text block dicts, all block text joined by spaces,
+        whether any text is in a non-gray color).
         """
         blocks = []
+        texts = []
+        has_color_text = False
+        # "dict" is the flattest output that still carries span fonts/sizes.
+        # Without TEXT_PRESERVE_IMAGES only text blocks come back, and every
+        # text block/line/span has a fixed set of keys, so index directly.
         text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
 
-        for block in text_dict.get("blocks", []):
-            if block.get("type") != 0:  # 0 = text block
+        for block in text_dict["blocks"]:
+            if block["type"] != 0:  # 0 = text block
                 continue
 
             block_text = []
-            font_sizes = []
-            font_names = []
+            size_sum = 0.0
+            size_count = 0
+            first_font = None
             is_bold = False
 
-            for line in block.get("lines", []):
-                line_text = ""
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
+            for line in block["lines"]:
+                parts = []
+                for span in line["spans"]:
+                    text = span["text"].strip()
                     if text:
-                        line_text += text + " "
-                        font_sizes.append(span.get("size", 12))
-                        font_names.append(span.get("font", ""))
-                        if "bold" in span.get("font", "").lower():
+                        font = span["font"]
+                        parts.append(text)
+                        size_sum += span["size"]
+                        size_count += 1
+                        if first_font is None:
+                            first_font = font
+                        if not is_bold and "bold" in font.lower():
                             is_bold = True
+                        if not has_color_text:
+                            # sRGB int; gray/black/white text has r == g == b
+                            color = span["color"]
+                            r, g, b = color >> 16, (color >> 8) & 0xFF, color & 0xFF
+                            has_color_text = max(r, g, b) - min(r, g, b) >= 16
 
-                line_text = line_text.strip()
-                if line_text:
-                    block_text.append(line_text)
+                if parts:
+                    block_text.append(" ".join(parts))
 
             full_text = "\n".join(block_text).strip()
             if not full_text:
                 continue
 
-            bbox = block.get("bbox", [0, 0, 0, 0])
-            avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12
+            bbox = block["bbox"]
+            avg_font_size = size_sum / size_count if size_count else 12
 
+            texts.append(full_text)
             blocks.append({
                 "text": full_text,
                 "bbox": {
@@ -79,10 +155,28 @@ class PDFExtractor:
                 },
                 "avg_font_size": round(avg_font_size, 1),
                 "is_bold": is_bold,
-                "font": font_names[0] if font_names else "",
+                "font": first_font or "",
             })
 
-        return blocks
+        return blocks, " ".join(texts), has_color_text
+
+    def page_has_graphics(self, page):
+        """
+        Cheap pre-check for anything worth rendering to sample colors:
+        an image, a filled shape (backgrounds, banners, boxes) or enough
+        stroked paths to be a chart or diagram.
+        """
+        try:
+            if page.get_images(full=False):
+                return True
+            # get_cdrawings skips building Point/Rect objects for every path
+            drawings = page.get_cdrawings()
+            if len(drawings) >= self.MIN_STROKES_FOR_COLORS:
+                return True
+            return any(d["type"] != "s" for d in drawings)  # "f"/"fs" are filled
+        except Exception:
+            # Can't tell; let extract_page_colors try (and fail) as before
+            return True
 
     def extract_page_colors(self, page, sample_size=1000):
         """
@@ -90,37 +184,36 @@ class PDFExtractor:
         Returns list of hex color strings sorted by frequency.
         """
         try:
-            # Render at low res for speed
-            pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5))
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-            img_array = np.array(img)
-
-            # Sample random pixels
+            # Render at quarter res, RGB without alpha: render cost scales
+            # with pixel area and dominant colors survive the downscale
+            pix = page.get_pixmap(matrix=fitz.Matrix(0.25, 0.25), colorspace=fitz.csRGB, alpha=False)
+            # Use the rendered pixel buffer as-is (no PNG encode/decode)
+            img_array = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+
+            # Sample an evenly strided grid of about sample_size pixels
+            # (contiguous rows, no O(h*w) permutation like random.choice)
             h, w = img_array.shape[:2]
-            if h * w < sample_size:
-                sample_size = h * w
+            stride = max(1, int(np.sqrt(h * w / sample_size)))
+            pixels = img_array[::stride, ::stride, :3].reshape(-1, 3)  # RGB only
+            sample_size = len(pixels)
 
-            indices = np.random.choice(h * w, size=sample_size, replace=False)
-            rows, cols = np.unravel_index(indices, (h, w))
-            pixels = img_array[rows, cols, :3]  # RGB only
-
-            # Quantize to reduce color space (round to nearest 16)
-            quantized = (pixels // 16) * 16
-            color_strings = [
-                f"#{r:02x}{g:02x}{b:02x}"
-                for r, g, b in quantized
-            ]
+            # Quantize to 16 levels per channel and pack into 12-bit bucket keys
+            q = (pixels >> 4).astype(np.uint16)
+            keys = (q[:, 0] << 8) | (q[:, 1] << 4) | q[:, 2]
+            counts = np.bincount(keys, minlength=4096)
 
             # Count and return top colors (excluding near-white and near-black)
-            counter = Counter(color_strings)
             colors = []
-            for color, count in counter.most_common(20):
+            for key in np.argsort(-counts, kind="stable")[:20]:
+                count = int(counts[key])
+                if not count:
+                    break
+                r, g, b = (int(key) >> 8) * 16, ((int(key) >> 4) & 0xF) * 16, (int(key) & 0xF) * 16
                 # Skip near-white (#e0e0e0+) and near-black (#202020-)
-                r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
                 brightness = (r + g + b) / 3
                 if 30 < brightness < 230:
                     colors.append({
-                        "hex": color,
+                        "hex": "#%02x%02x%02x" % (r, g, b),
                         "frequency": round(count / sample_size, 3),
                     })
 
@@ -129,11 +222,11 @@ class PDFExtractor:
         except Exception as e:
             return []
 
-    def classify_slide_type(self, text_blocks):
+    def classify_slide_type(self, text_blocks, full_text=None):
         """
         Heuristic classification of slide type based on text patterns.
+        Pass the already-joined slide text as `full_text` to avoid re-joining.
         """
-        full_text = " ".join(b["text"] for b in text_blocks).lower()
         num_blocks = len(text_blocks)
 
         # Title slide: few blocks, large font
@@ -142,33 +235,42 @@ class PDFExtractor:
             if avg_size > 18:
                 return "title"
 
+        # Find every keyword category present in a single pass over the text
+        if full_text is None:
+            full_text = " ".join(b["text"] for b in text_blocks)
+        full_text = full_text.lower()
+        found = 0
+        for _, bits in _KEYWORD_AUTOMATON.iter(full_text):
+            found |= bits
+            if found & _AGENDA:
+                break  # Agenda outranks every other category
+
         # Agenda
-        if any(w in full_text for w in ["agenda", "outline", "overview", "table of contents"]):
+        if found & _AGENDA:
             return "agenda"
 
         # Questions slide
-        if re.search(r"question|discussion|\?{2,}", full_text) and num_blocks <= 3:
+        if found & _QUESTIONS and num_blocks <= 3:
             return "questions"
 
         # Backup slides marker
-        if "backup" in full_text and num_blocks <= 3:
+        if found & _BACKUP and num_blocks <= 3:
             return "backup"
 
         # Budget/financial table
-        if any(w in full_text for w in ["fy2", "fy1", "fydp", "budget", "funding", "$ in", "rdt&e", "procurement"]):
-            if any(w in full_text for w in ["total", "mil", "000", "$"]):
-                return "budget"
+        if found & _BUDGET and found & _BUDGET_AMOUNT:
+            return "budget"
 
         # Timeline
-        if any(w in full_text for w in ["timeline", "schedule", "milestone", "roadmap", "phased"]):
+        if found & _TIMELINE:
             return "timeline"
 
         # Org chart
-        if any(w in full_text for w in ["organization", "command", "governance", "reporting"]):
+        if found & _ORGCHART:
             return "orgchart"
 
         # Matrix / stoplight chart
-        if any(w in full_text for w in ["risk", "matrix", "assessment", "status", "stoplight", "red", "yellow", "green"]):
+        if found & _MATRIX:
             return "matrix"
 
         # Default: bullet slide
@@ -178,88 +280,157 @@ class PDFExtractor:
         """
         Find acronyms (2-6 uppercase letters, optionally with numbers and slashes).
         """
-        # Match patterns like: DARPA, JADC2, USD(R&E), C4ISR, NC3
-        pattern = r'\b([A-Z][A-Z0-9/&]{1,8}(?:\([A-Z&/]+\))?)\b'
-        matches = re.findall(pattern, text)
-        return [m for m in matches if len(m) >= 2 and not m.isdigit()]
+        # Deduplicate here, keeping first-seen order for stable output
+        return list(dict.fromkeys(
+            m for m in _ACRONYM_RE.findall(text) if len(m) >= 2 and not m.isdigit()
+        ))
 
-    def process_pdf(self, pdf_path):
+    def extract_acronyms_batch(self, texts):
+        """
+        Same as extract_acronyms, but for many slides at once. Runs a single
+        regex scan over the joined texts and buckets matches back by offset.
+        """
+        # \x1f is a non-word char, so \b still anchors at slide boundaries
+        # and no match can span two slides
+        joined = "\x1f".join(texts)
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        found = [[] for _ in texts]
+        for m in _ACRONYM_RE.finditer(joined):
+            acr = m.group(1)
+            if len(acr) >= 2 and not acr.isdigit():
+                found[bisect_right(starts, m.start()) - 1].append(acr)
+
+        return [list(dict.fromkeys(acrs)) for acrs in found]
+
+    def process_pdf(self, pdf_path, start=0, stop=None):
         """
         Process a single PDF file. Returns list of slide data dicts.
+        `start`/`stop` limit processing to that page range.
         """
         slides = []
+        page_texts = []
 
         try:
-            doc = fitz.open(pdf_path)
             filename = os.path.basename(pdf_path)
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-
-                # Extract text blocks
-                text_blocks = self.extract_page_text(page)
-                if not text_blocks:
-                    continue  # Skip blank slides
-
-                # Extract colors
-                colors = self.extract_page_colors(page)
-
-                # Full text for analysis
-                full_text = " ".join(b["text"] for b in text_blocks)
-
-                # Classify slide type
-                slide_type = self.classify_slide_type(text_blocks)
-
-                # Extract acronyms
-                acronyms = self.extract_acronyms(full_text)
-
-                # Identify title block (largest font, near top)
-                title_block = None
-                for block in sorted(text_blocks, key=lambda b: b["avg_font_size"], reverse=True):
-                    if block["bbox"]["y"] < page.rect.height * 0.3:
-                        title_block = block["text"]
-                        break
-
-                slides.append({
-                    "source_file": filename,
-                    "page_num": page_num,
-                    "slide_type": slide_type,
-                    "title": title_block or "",
-                    "full_text": full_text[:2000],  # Cap length
-                    "text_blocks": [{
-                        "text": b["text"][:500],
-                        "font_size": b["avg_font_size"],
-                        "is_bold": b["is_bold"],
-                        "position": {
-                            "x_pct": round(b["bbox"]["x"] / max(page.rect.width, 1) * 100, 1),
-                            "y_pct": round(b["bbox"]["y"] / max(page.rect.height, 1) * 100, 1),
-                        }
-                    } for b in text_blocks[:20]],  # Cap block count
-                    "colors": colors,
-                    "acronyms": list(set(acronyms)),
-                    "num_text_blocks": len(text_blocks),
-                    "page_width": round(page.rect.width, 1),
-                    "page_height": round(page.rect.height, 1),
-                })
-
-            doc.close()
+            with fitz.open(pdf_path, filetype="pdf") as doc:
+                for page_num, page in enumerate(doc.pages(start, stop), start):
+                    # page.rect builds a new Rect on every access; read it once
+                    rect = page.rect
+                    page_w = max(rect.width, 1)
+                    page_h = max(rect.height, 1)
+
+                    # Extract text blocks
+                    text_blocks, full_text, has_color_text = self.extract_page_text(page)
+                    if not text_blocks:
+                        continue  # Skip blank slides
+
+                    # Extract colors (rendering is the costliest step per page,
+                    # so skip it for white-background slides with only gray text)
+                    if has_color_text or self.page_has_graphics(page):
+                        colors = self.extract_page_colors(page)
+                    else:
+                        colors = []
+
+                    # Classify slide type
+                    slide_type = self.classify_slide_type(text_blocks, full_text)
+
+                    # Identify title block (largest font, near top)
+                    title_block = None
+                    best_size = -1.0
+                    y_cutoff = rect.height * 0.3
+                    for block in text_blocks:
+                        if block["bbox"]["y"] < y_cutoff and block["avg_font_size"] > best_size:
+                            best_size = block["avg_font_size"]
+                            title_block = block["text"]
+
+                    slides.append({
+                        "source_file": filename,
+                        "page_num": page_num,
+                        "slide_type": slide_type,
+                        "title": title_block or "",
+                        "full_text": full_text[:self.MAX_FULL_TEXT_CHARS],
+                        "text_blocks": [{
+                            "text": b["text"][:self.MAX_BLOCK_TEXT_CHARS],
+                            "font_size": b["avg_font_size"],
+                            "is_bold": b["is_bold"],
+                            "position": {
+                                "x_pct": round(b["bbox"]["x"] / page_w * 100, 1),
+                                "y_pct": round(b["bbox"]["y"] / page_h * 100, 1),
+                            }
+                        } for b in text_blocks[:self.MAX_TEXT_BLOCKS]],
+                        "colors": colors,
+                        "acronyms": [],  # Filled in below, one regex pass per PDF
+                        "num_text_blocks": len(text_blocks),
+                        "page_width": round(rect.width, 1),
+                        "page_height": round(rect.height, 1),
+                    })
+                    page_texts.append(full_text)
 
         except Exception as e:
             print(f"  Error processing {pdf_path}: {e}")
 
+        # Extract acronyms (after the try, so slides read before an error
+        # still get theirs)
+        for slide, acronyms in zip(slides, self.extract_acronyms_batch(page_texts)):
+            slide["acronyms"] = acronyms
+
         return slides
 
-    def process_all(self, pdf_paths):
+    def _get_max_workers(self, num_paths):
+        return max(1, min(self.workers, num_paths))
+
+    def _page_ranges(self, pdf_paths):
         """
-        Process multiple PDFs. Returns flat list of all slide data.
+        Split work into (path, start, stop) tasks. With fewer PDFs than
+        workers, large decks are cut into page ranges so the spare workers
+        aren't left idle while one process renders a long deck serially.
         """
-        all_slides = []
+        if len(pdf_paths) >= self.workers:
+            return [(path, 0, None) for path in pdf_paths]
+
+        tasks = []
+        for path in pdf_paths:
+            try:
+                with fitz.open(path, filetype="pdf") as doc:
+                    num_pages = len(doc)
+            except Exception:
+                # Let process_pdf report the error for this file
+                tasks.append((path, 0, None))
+                continue
+            for start in range(0, max(num_pages, 1), self.PAGES_PER_TASK):
+                tasks.append((path, start, start + self.PAGES_PER_TASK))
+        return tasks
 
-        for path in tqdm(pdf_paths, desc="Extracting slides"):
-            slides = self.process_pdf(path)
-            all_slides.extend(slides)
+    def _process_task(self, task):
+        return self.process_pdf(*task)
 
-        return all_slides
+    def process_all(self, pdf_paths, out_path):
+        """
+        Process multiple PDFs in parallel worker processes, streaming each
+        PDF's slides to `out_path` as JSON Lines (one slide per line) as soon
+        as it finishes, so the corpus is never held in memory at once.
+        Returns the number of slides written.
+        """
+        num_slides = 0
+        tasks = self._page_ranges(pdf_paths)
+
+        with open(out_path, "wb") as f, \
+                ProcessPoolExecutor(max_workers=self._get_max_workers(len(tasks))) as ex:
+            # map() yields in submission order, so each deck's page ranges
+            # are written back in page order
+            results = ex.map(self._process_task, tasks, chunksize=1)
+            for slides in tqdm(results, total=len(tasks), desc="Extracting slides"):
+                for slide in slides:
+                    f.write(_dumps_line(slide))
+                num_slides += len(slides)
+
+        return num_slides
 
 
 if __name__ == "__main__":
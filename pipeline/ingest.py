@@ -18,7 +18,7 @@ import sys
 
 from crawler import ArchiveCrawler
 from extractor import PDFExtractor
-from analyzer import SlideAnalyzer
+from analyzer import SlideAnalyzer, JsonlSlides
 from build_corpus import CorpusBuilder
 
 
@@ -34,6 +34,8 @@ def main():
                         help="Output directory for corpus (default: ../corpus)")
     parser.add_argument("--download-dir", type=str, default=None,
                         help="Directory for downloaded PDFs (default: ../downloads)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for extraction/analysis (default: CPU count)")
     args = parser.parse_args()
 
     # Resolve directories relative to project root
@@ -72,16 +74,17 @@ def main():
     print("\n" + "=" * 60)
     print("STAGE 2: Extracting text, colors, and layouts")
     print("=" * 60)
-    extractor = PDFExtractor()
-    extracted_data = extractor.process_all(downloaded)
-    print(f"Extracted data from {len(extracted_data)} slides")
+    extractor = PDFExtractor(workers=args.workers)
+    slides_path = os.path.join(download_dir, "extracted_slides.jsonl")
+    num_slides = extractor.process_all(downloaded, slides_path)
+    print(f"Extracted data from {num_slides} slides to {slides_path}")
 
     # Stage 3: Analyze patterns
     print("\n" + "=" * 60)
     print("STAGE 3: Analyzing slide patterns")
     print("=" * 60)
-    analyzer = SlideAnalyzer()
-    analysis = analyzer.analyze(extracted_data)
+    analyzer = SlideAnalyzer(workers=args.workers)
+    analysis = analyzer.analyze(JsonlSlides(slides_path))
     print(f"Analysis complete: {len(analysis['vocabulary'])} vocabulary terms, "
           f"{len(analysis['acronyms'])} acronyms, "
           f"{len(analysis['palettes'])} color palettes")